@@ -2,11 +2,33 @@
 
 from __future__ import annotations
 
+import hashlib
+import heapq
+import json
+import os
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
 import typer
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 
 from gitstats import __version__
+from gitstats.parser import (
+    aggregate,
+    get_author_stats,
+    get_commit_stats,
+    get_commit_streaks,
+    get_hourly_activity,
+    get_summary_stats,
+    get_weekly_activity,
+)
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib encoder is the fallback
+    orjson = None
 
 app = typer.Typer(
     name="gitstats",
@@ -15,6 +37,64 @@ app = typer.Typer(
 )
 console = Console()
 
+# Longest bar is 50 cells; slicing a shared string beats re-allocating per row
+_BLOCK = "█" * 64
+
+
+def _encode_json(obj: dict) -> bytes:
+    """Serialize to indented JSON bytes, preferring orjson's C encoder."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2) + b"\n"
+    return (json.dumps(obj, indent=2) + "\n").encode()
+
+
+def _write_json(obj: dict) -> None:
+    """Write JSON straight to stdout, bypassing Rich's markup renderer."""
+    sys.stdout.buffer.write(_encode_json(obj))
+    sys.stdout.buffer.flush()
+
+
+def _result_cache_file(path: str, *filters) -> Path | None:
+    """
+    Map a repository state plus filter set to a result-cache file.
+
+    The file name is <query>-<state>.json. The query half identifies
+    the repo path and filter values; the state half folds in the
+    content and mtime of .git/HEAD, the mtimes of packed-refs and the
+    refs directory (any ref update changes one of them), today's date
+    (streaks depend on it) and the package version, so a release that
+    changes the JSON shape never replays old payloads. Writers delete
+    superseded states for the same query, keeping one entry per
+    repo/filter combination. Returns None when the repo state cannot
+    be read.
+    """
+    git_dir = Path(path) / ".git"
+    state = hashlib.sha256()
+    try:
+        head = git_dir / "HEAD"
+        head_content = head.read_bytes()
+        state.update(head_content)
+        state.update(str(head.stat().st_mtime_ns).encode())
+    except OSError:
+        return None
+    if head_content.startswith(b"ref: "):
+        # Symbolic HEAD: the tip lives in the named ref file, so fold in
+        # its content too (a new commit does not touch .git/HEAD itself)
+        ref = git_dir / head_content[5:].strip().decode("utf-8", "replace")
+        try:
+            state.update(ref.read_bytes())
+        except OSError:
+            pass
+    for name in ("packed-refs", "refs", "logs/HEAD"):
+        try:
+            state.update(str((git_dir / name).stat().st_mtime_ns).encode())
+        except OSError:
+            pass
+    state.update(repr((date.today(), __version__)).encode())
+    query = hashlib.sha256(repr((str(Path(path).resolve()), *filters)).encode())
+    cache_dir = Path.home() / ".cache" / "gitstats" / "results"
+    return cache_dir / f"{query.hexdigest()[:24]}-{state.hexdigest()[:24]}.json"
+
 
 def version_callback(value: bool) -> None:
     """Print version and exit."""
@@ -71,17 +151,49 @@ def stats(
         "-t",
         help="Show only top N contributors",
     ),
+    summary: bool = typer.Option(
+        False,
+        "--summary",
+        help="Show totals and contributors only (fast, skips per-commit parsing)",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Do not reuse cached results from previous runs",
+    ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        "-w",
+        help="Parse the log with this many worker processes (large repos only)",
+    ),
 ) -> None:
     """Show commit statistics for a git repository."""
-    import json
-    from datetime import datetime
-
-    from gitstats.parser import (
-        get_commit_stats,
-        get_commit_streaks,
-        get_hourly_activity,
-        get_weekly_activity,
-    )
+    # Repeat runs on an unchanged repo can replay the cached JSON payload
+    # without touching git at all. Pretty output is not cached because it
+    # depends on the terminal width.
+    cache_file = None
+    if json_output and not no_cache and not summary:
+        cache_file = _result_cache_file(path, since, until, author, top)
+        if cache_file is not None:
+            try:
+                payload = cache_file.read_bytes()
+            except OSError:
+                payload = None
+            if payload:
+                sys.stdout.buffer.write(payload)
+                return
+
+    if summary:
+        if since or until or author:
+            error_msg = "--summary cannot be combined with --since/--until/--author"
+            if json_output:
+                _write_json({"error": error_msg})
+            else:
+                console.print(f"[red]{error_msg}[/]")
+            raise typer.Exit(1)
+        _print_summary(path, get_summary_stats(path), json_output=json_output, top=top)
+        return
 
     # Parse date filters
     since_date = None
@@ -101,11 +213,11 @@ def stats(
             console.print(f"[red]Invalid date format for --until: {until}. Use YYYY-MM-DD[/]")
             raise typer.Exit(1)
 
-    stats_data = get_commit_stats(path)
+    stats_data = get_commit_stats(path, workers=workers)
 
     if not stats_data:
         if json_output:
-            console.print(json.dumps({"error": "No commits found or not a git repository"}))
+            _write_json({"error": "No commits found or not a git repository"})
         else:
             console.print("[red]No commits found or not a git repository.[/]")
         raise typer.Exit(1)
@@ -122,30 +234,33 @@ def stats(
         commits = _filter_commits_by_author(commits, author)
         filters_applied.append("author")
 
-    if filters_applied and not commits:
+    if filters_applied and not commits["timestamps"]:
         error_msg = "No commits found matching the specified filters"
         if json_output:
-            console.print(json.dumps({"error": error_msg}))
+            _write_json({"error": error_msg})
         else:
             console.print(f"[red]{error_msg}[/]")
         raise typer.Exit(1)
 
     # Recalculate stats if any filters were applied
-    if filters_applied:
-        from gitstats.parser import get_author_stats
+    agg = stats_data["aggregate"]
 
-        unique_authors = {c["author"] for c in commits}
+    if filters_applied:
+        agg = aggregate(commits)
+        timestamps = commits["timestamps"]
         stats_data = {
             **stats_data,
             "commits": commits,
-            "total_commits": len(commits),
-            "total_authors": len(unique_authors),
-            "first_commit": commits[0]["date"].strftime("%Y-%m-%d"),
-            "last_commit": commits[-1]["date"].strftime("%Y-%m-%d"),
-            "author_stats": get_author_stats(commits),
+            "total_commits": len(timestamps),
+            # The aggregate's author Counter already knows the distinct count
+            "total_authors": len(agg["author_counts"]),
+            "first_commit": datetime.fromtimestamp(timestamps[0]).date().isoformat(),
+            "last_commit": datetime.fromtimestamp(timestamps[-1]).date().isoformat(),
+            "author_stats": get_author_stats(agg),
+            "aggregate": agg,
         }
 
-    streaks = get_commit_streaks(stats_data["commits"])
+    streaks = get_commit_streaks(agg)
 
     if json_output:
         # Build JSON output
@@ -156,59 +271,123 @@ def stats(
             "first_commit": stats_data["first_commit"],
             "last_commit": stats_data["last_commit"],
             "filters": {
-                "since": since_date.strftime("%Y-%m-%d") if since_date else None,
-                "until": until_date.strftime("%Y-%m-%d") if until_date else None,
+                "since": since_date.date().isoformat() if since_date else None,
+                "until": until_date.date().isoformat() if until_date else None,
                 "author": author,
                 "top": top,
             },
-            "authors": stats_data["author_stats"][:top] if top else stats_data["author_stats"],
+            "authors": get_author_stats(agg, top=top) if top else stats_data["author_stats"],
             "streaks": streaks,
-            "weekly_activity": get_weekly_activity(stats_data["commits"]),
-            "hourly_activity": get_hourly_activity(stats_data["commits"]),
+            "weekly_activity": get_weekly_activity(agg),
+            "hourly_activity": get_hourly_activity(agg),
         }
-        console.print(json.dumps(output, indent=2))
+        payload = _encode_json(output)
+        sys.stdout.buffer.write(payload)
+        sys.stdout.buffer.flush()
+        if cache_file is not None:
+            # Temp file + rename keeps the cache entry atomic: a reader
+            # racing this write sees either the old payload or the new
+            # one, never a partial file.
+            tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file.write_bytes(payload)
+                os.replace(tmp_file, cache_file)
+                # Drop superseded states of the same query so the cache
+                # dir does not grow by one file per repo per day
+                query = cache_file.name.split("-", 1)[0]
+                for stale in cache_file.parent.glob(f"{query}-*.json"):
+                    if stale != cache_file:
+                        stale.unlink(missing_ok=True)
+            except OSError:
+                pass
         return
 
-    # Pretty terminal output
-    console.print(f"\n[bold]📊 Git Statistics for:[/] [cyan]{path}[/]")
+    # Pretty terminal output: collect every renderable and print once so
+    # Rich enters its rendering pipeline a single time
+    body = [f"\n[bold]📊 Git Statistics for:[/] [cyan]{path}[/]"]
 
     # Show filters if applied
     if filters_applied:
         filter_parts = []
         if since_date:
-            filter_parts.append(f"from {since_date.strftime('%Y-%m-%d')}")
+            filter_parts.append(f"from {since_date.date().isoformat()}")
         if until_date:
-            filter_parts.append(f"to {until_date.strftime('%Y-%m-%d')}")
+            filter_parts.append(f"to {until_date.date().isoformat()}")
         if author:
             filter_parts.append(f"author: {author}")
-        console.print(f"[dim]Filtered: {' '.join(filter_parts)}[/]")
+        body.append(f"[dim]Filtered: {' '.join(filter_parts)}[/]")
 
-    console.print()
+    body.append("")
+    body.append(f"[bold]Total commits:[/] [green]{stats_data['total_commits']}[/]")
+    body.append(f"[bold]Contributors:[/] [green]{stats_data['total_authors']}[/]")
+    body.append(f"[bold]First commit:[/] [yellow]{stats_data['first_commit']}[/]")
+    body.append(f"[bold]Latest commit:[/] [yellow]{stats_data['last_commit']}[/]")
+    body.append("")
 
-    console.print(f"[bold]Total commits:[/] [green]{stats_data['total_commits']}[/]")
-    console.print(f"[bold]Contributors:[/] [green]{stats_data['total_authors']}[/]")
-    console.print(f"[bold]First commit:[/] [yellow]{stats_data['first_commit']}[/]")
-    console.print(f"[bold]Latest commit:[/] [yellow]{stats_data['last_commit']}[/]")
-    console.print()
-
-    # Show author breakdown table
+    # Author breakdown table
     if stats_data.get("author_stats"):
         author_stats_display = stats_data["author_stats"]
         if top and top > 0:
-            author_stats_display = author_stats_display[:top]
-        _print_author_table(author_stats_display, top=top, total=len(stats_data["author_stats"]))
+            author_stats_display = get_author_stats(agg, top=top)
+        body.append(_author_table(author_stats_display, top=top, total=stats_data["total_authors"]))
+        body.append("")
 
-    # Show activity heatmap
-    _print_activity_heatmap(stats_data["commits"])
+    # Activity heatmap and streaks
+    body.extend(_activity_renderables(agg))
+    body.extend(_streak_renderables(streaks))
 
-    # Show streaks
-    _print_streaks(streaks)
+    console.print(Group(*body))
 
 
-def _print_author_table(
-    author_stats: list[dict], top: int | None = None, total: int | None = None
+def _print_summary(
+    path: str, summary_data: dict | None, json_output: bool, top: int | None
 ) -> None:
-    """Print a table of author statistics."""
+    """Print summary-only statistics from the git shortlog fast path."""
+    if not summary_data:
+        if json_output:
+            _write_json({"error": "No commits found or not a git repository"})
+        else:
+            console.print("[red]No commits found or not a git repository.[/]")
+        raise typer.Exit(1)
+
+    author_stats = summary_data["author_stats"]
+
+    if json_output:
+        _write_json(
+            {
+                "repository": path,
+                "total_commits": summary_data["total_commits"],
+                "total_authors": summary_data["total_authors"],
+                "first_commit": summary_data["first_commit"],
+                "last_commit": summary_data["last_commit"],
+                "filters": {"top": top},
+                "authors": author_stats[:top] if top else author_stats,
+            }
+        )
+        return
+
+    if top and top > 0:
+        author_stats = author_stats[:top]
+
+    console.print(
+        Group(
+            f"\n[bold]📊 Git Statistics for:[/] [cyan]{path}[/]\n",
+            f"[bold]Total commits:[/] [green]{summary_data['total_commits']}[/]",
+            f"[bold]Contributors:[/] [green]{summary_data['total_authors']}[/]",
+            f"[bold]First commit:[/] [yellow]{summary_data['first_commit']}[/]",
+            f"[bold]Latest commit:[/] [yellow]{summary_data['last_commit']}[/]",
+            "",
+            _author_table(author_stats, top=top, total=summary_data["total_authors"]),
+            "",
+        )
+    )
+
+
+def _author_table(
+    author_stats: list[dict], top: int | None = None, total: int | None = None
+) -> Table:
+    """Build the table of author statistics."""
     title = "👥 Commits by Author"
     if top and total and top < total:
         title += f" (top {top} of {total})"
@@ -221,7 +400,7 @@ def _print_author_table(
 
     for stat in author_stats:
         bar_width = int(stat["percentage"] / 2)  # Max 50 chars for 100%
-        bar = "█" * bar_width
+        bar = _BLOCK[:bar_width]
 
         table.add_row(
             stat["author"],
@@ -230,76 +409,80 @@ def _print_author_table(
             bar,
         )
 
-    console.print(table)
-    console.print()
-
+    return table
 
-def _print_activity_heatmap(commits: list[dict]) -> None:
-    """Print activity heatmap by day and hour."""
-    from gitstats.parser import get_hourly_activity, get_weekly_activity
 
+def _activity_renderables(agg: dict) -> list:
+    """Build the activity heatmap lines (weekday bars and peak hours)."""
     # Weekly activity
-    weekly = get_weekly_activity(commits)
+    weekly = get_weekly_activity(agg)
 
-    console.print("[bold]📅 Activity by Day of Week[/]\n")
+    lines = ["[bold]📅 Activity by Day of Week[/]\n"]
 
-    max_commits = max(d["commits"] for d in weekly) if weekly else 1
+    # The aggregate already holds the raw buckets, so no second pass over
+    # the rendered dicts is needed to find the busiest day
+    max_commits = max(agg["weekday_counts"], default=0)
 
     for day_stat in weekly:
         bar_width = int((day_stat["commits"] / max_commits) * 30) if max_commits else 0
-        bar = "█" * bar_width
+        bar = _BLOCK[:bar_width]
 
-        console.print(
+        lines.append(
             f"  [cyan]{day_stat['day']}[/] │ [green]{bar:<30}[/] {day_stat['commits']:>3} commits"
         )
 
-    console.print()
+    lines.append("")
 
     # Hourly activity (simplified - peak hours)
-    hourly = get_hourly_activity(commits)
-    peak_hours = sorted(hourly, key=lambda x: x["commits"], reverse=True)[:3]
+    hourly = get_hourly_activity(agg)
+    peak_hours = heapq.nlargest(3, hourly, key=lambda x: x["commits"])
 
     if peak_hours and peak_hours[0]["commits"] > 0:
-        console.print("[bold]⏰ Peak Coding Hours[/]\n")
+        lines.append("[bold]⏰ Peak Coding Hours[/]\n")
         for h in peak_hours:
             if h["commits"] > 0:
                 hour_str = f"{h['hour']:02d}:00"
-                console.print(
+                lines.append(
                     f"  [yellow]{hour_str}[/] - {h['commits']} commits ({h['percentage']:.1f}%)"
                 )
-        console.print()
+        lines.append("")
+
+    return lines
+
 
+def _take_commits(commits: dict, indices: list[int]) -> dict:
+    """Slice every commit column down to the given indices."""
+    return {name: [column[i] for i in indices] for name, column in commits.items()}
 
-def _filter_commits_by_author(commits: list[dict], author: str) -> list[dict]:
+
+def _filter_commits_by_author(commits: dict, author: str) -> dict:
     """Filter commits by author name (case-insensitive partial match)."""
     author_lower = author.lower()
-    return [c for c in commits if author_lower in c["author"].lower()]
+    indices = [i for i, a in enumerate(commits["authors_lower"]) if author_lower in a]
+    return _take_commits(commits, indices)
 
 
 def _filter_commits_by_date(
-    commits: list[dict],
+    commits: dict,
     since_date,
     until_date,
-) -> list[dict]:
+) -> dict:
     """Filter commits by date range."""
-    filtered = commits
-
-    if since_date:
-        filtered = [c for c in filtered if c["date"].replace(tzinfo=None) >= since_date]
-
-    if until_date:
-        # Include the entire "until" day
-        from datetime import timedelta
+    since_ts = since_date.timestamp() if since_date else None
+    # Include the entire "until" day
+    until_ts = (until_date + timedelta(days=1)).timestamp() if until_date else None
 
-        until_end = until_date + timedelta(days=1)
-        filtered = [c for c in filtered if c["date"].replace(tzinfo=None) < until_end]
+    indices = [
+        i
+        for i, ts in enumerate(commits["timestamps"])
+        if (since_ts is None or ts >= since_ts) and (until_ts is None or ts < until_ts)
+    ]
+    return _take_commits(commits, indices)
 
-    return filtered
 
-
-def _print_streaks(streaks: dict) -> None:
-    """Print commit streak statistics."""
-    console.print("[bold]🔥 Commit Streaks[/]\n")
+def _streak_renderables(streaks: dict) -> list:
+    """Build the commit streak lines."""
+    lines = ["[bold]🔥 Commit Streaks[/]\n"]
 
     current = streaks["current_streak"]
     longest = streaks["longest_streak"]
@@ -308,13 +491,15 @@ def _print_streaks(streaks: dict) -> None:
     # Current streak with fire emojis based on length
     if current > 0:
         fires = "🔥" * min(current, 5)
-        console.print(f"  [green]Current streak:[/] {current} days {fires}")
+        lines.append(f"  [green]Current streak:[/] {current} days {fires}")
     else:
-        console.print("  [dim]Current streak:[/] 0 days (no recent commits)")
+        lines.append("  [dim]Current streak:[/] 0 days (no recent commits)")
+
+    lines.append(f"  [yellow]Longest streak:[/] {longest} days")
+    lines.append(f"  [cyan]Total active days:[/] {active_days}")
+    lines.append("")
 
-    console.print(f"  [yellow]Longest streak:[/] {longest} days")
-    console.print(f"  [cyan]Total active days:[/] {active_days}")
-    console.print()
+    return lines
 
 
 if __name__ == "__main__":